@@ -2,41 +2,115 @@
 RecordSerializer - Handles type validation and serialization for Records.
 """
 
+import asyncio
 import json
+import math
+import mmap
 import os
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import re
+import time
+from itertools import islice
+from typing import Any, Dict, Optional, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
+
+# Records are streamed to disk one by one, the buffer batches them into
+# a handful of write syscalls even for large snapshots.
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Encoded records are joined and written in batches of this many records,
+# one buffered write call per batch instead of one per record.
+_WRITE_BATCH_RECORDS = 1024
+
+_SCALAR_TYPES = (bool, int, float, str)
+
+# orjson parses integers outside the int64/uint64 range as floats. Those have at least
+# 19 digits, float reprs never contain such a run, so any match may hide an exact integer.
+_LONG_DIGIT_RUN = re.compile(rb'\d{19}')
+
+# Deepest container nesting accepted in a field value. The stdlib encoder and decoder
+# recurse per level, this leaves ample room below the interpreter's recursion limit.
+_MAX_NESTING_DEPTH = 512
+_EXACT_SCALAR_TYPES = frozenset((type(None), bool, int, float, str))
+
+
+def _is_supported_value(value: Any) -> bool:
+    """Check if a value is supported, walking nested lists and dicts without recursion."""
+    # Exact types are a set lookup, subclasses fall through to isinstance
+    if type(value) in _EXACT_SCALAR_TYPES:
+        return True
+    
+    # Depth-first walk over a stack of iterators, one per container being checked
+    iterators = [iter((value,))]
+    path = [None]
+    active = set()
+    while iterators:
+        for item in iterators[-1]:
+            item_type = type(item)
+            if item_type in _EXACT_SCALAR_TYPES:
+                continue
+            
+            # Lists - all elements must be supported
+            if item_type is list or (item_type is not dict and isinstance(item, list)):
+                children = iter(item)
+            # Dicts - all values must be supported, keys must be strings
+            elif item_type is dict or isinstance(item, dict):
+                if not all(type(key) is str or isinstance(key, str) for key in item):
+                    return False
+                children = iter(item.values())
+            elif isinstance(item, _SCALAR_TYPES):
+                continue
+            else:
+                return False
+            
+            # A container that contains itself cannot be written as JSON
+            item_id = id(item)
+            if item_id in active:
+                return False
+            # Neither encoder can write arbitrarily deep nesting
+            if len(path) > _MAX_NESTING_DEPTH:
+                return False
+            active.add(item_id)
+            path.append(item_id)
+            iterators.append(children)
+            break
+        else:
+            iterators.pop()
+            active.discard(path.pop())
+    return True
+
+
+def _has_non_finite_float(value: Any) -> bool:
+    """Check if a JSON-native value holds NaN or an infinity anywhere, walking containers without recursion."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, list):
+            stack.extend(item)
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+    return False
+
 
 class RecordSerializer:
     """Handles type validation and serialization for Records."""
     
-    @staticmethod
-    def is_supported_value(value: Any) -> bool:
-        """Check if a value is supported (recursively for lists and dicts)."""
-        if value is None:
-            return True
-        
-        # Basic supported types
-        if isinstance(value, (bool, int, float, str)):
-            return True
-        
-        # Lists - all elements must be supported
-        if isinstance(value, list):
-            return all(RecordSerializer.is_supported_value(item) for item in value)
-        
-        # Dicts - all values must be supported, keys must be strings
-        if isinstance(value, dict):
-            return (all(isinstance(key, str) for key in value.keys()) and
-                    all(RecordSerializer.is_supported_value(val) for val in value.values()))
-        
-        return False
+    is_supported_value = staticmethod(_is_supported_value)
+    
+    # Timestamp of the last snapshot name handed out by this process
+    _last_timestamp = 0
     
     @staticmethod
     def validate_value(value: Any, attribute_name: str, collection_name: str) -> None:
         """Validate that a value is supported. Raises TypeError if not."""
-        if not RecordSerializer.is_supported_value(value):
+        if not _is_supported_value(value):
             raise TypeError(
                 f"Attribute '{attribute_name}' in collection '{collection_name}' "
                 f"must be JSON-native (bool, int, float, str, list, dict), got {type(value).__name__}"
@@ -49,42 +123,143 @@ class RecordSerializer:
     
     @staticmethod
     def _get_timestamped_filename() -> str:
-        """Generate a timestamped filename."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]  # microseconds to milliseconds
+        """Generate a timestamped filename, later than any name generated before in this process."""
+        timestamp = max(time.time_ns(), RecordSerializer._last_timestamp + 1)
+        RecordSerializer._last_timestamp = timestamp
         return f"{timestamp}.json"
     
+    @staticmethod
+    def _snapshot_sort_key(filename: str) -> Tuple[int, int, str]:
+        """Chronological sort key for a snapshot filename.
+        
+        Filenames are nanosecond timestamps. Older versions wrote datetime-formatted names
+        such as 20250101_120000_123.json, those always sort before nanosecond names.
+        """
+        stem = filename[:-5]
+        if stem.isdigit():
+            return (1, len(stem), stem)
+        return (0, 0, stem)
+    
     @staticmethod
     def _get_most_recent_file(records_dir: Path) -> Optional[Path]:
         """Get the most recent records file from the .records directory."""
         if not records_dir.exists():
             return None
         
-        json_files = list(records_dir.glob("*.json"))
-        if not json_files:
-            return None
-        
-        # Sort by filename (timestamp) in descending order
-        json_files.sort(key=lambda x: x.name, reverse=True)
-        return json_files[0]
+        most_recent = None
+        most_recent_key = None
+        with os.scandir(records_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".json"):
+                    continue
+                key = RecordSerializer._snapshot_sort_key(name)
+                if most_recent_key is None or key > most_recent_key:
+                    most_recent, most_recent_key = name, key
+        return records_dir / most_recent if most_recent is not None else None
     
     @staticmethod
-    def serialize_and_persist(collections: Dict[str, List['Record']], base_path: Path) -> None:
-        """Convert collections to serializable format and persist to timestamped file."""
+    def _encode(value: Any) -> bytes:
+        """Encode a single JSON-native value to compact JSON bytes."""
+        if orjson is not None:
+            try:
+                encoded = orjson.dumps(value)
+            except orjson.JSONEncodeError:
+                # orjson rejects integers beyond 64 bits, stdlib json does not
+                pass
+            else:
+                # orjson writes NaN and infinities as null, stdlib json keeps them
+                if b'null' not in encoded or not _has_non_finite_float(value):
+                    return encoded
+        try:
+            # Values are validated acyclic JSON-native trees, skip the circular check
+            return json.dumps(value, ensure_ascii=False, check_circular=False).encode()
+        except UnicodeEncodeError:
+            # Lone surrogates have no UTF-8 form, keep them as \u escapes
+            return json.dumps(value, check_circular=False).encode()
+    
+    @staticmethod
+    def serialize_and_persist(collections: Dict[str, Dict[int, 'Record']], base_path: Path) -> None:
+        """Stream collections record by record to a timestamped file."""
         records_dir = base_path.parent / ".records"
         RecordSerializer._ensure_records_dir(records_dir)
         
-        filename = RecordSerializer._get_timestamped_filename()
-        file_path = records_dir / filename
+        # Write to a temporary name first, a half-written snapshot never looks like the most recent one
+        while True:
+            tmp_path = records_dir / (RecordSerializer._get_timestamped_filename() + ".tmp")
+            try:
+                f = open(tmp_path, 'xb', buffering=_WRITE_BUFFER_SIZE)
+                break
+            except FileExistsError:
+                continue
         
-        data = {}
-        for collection_name, records_list in collections.items():
-            data[collection_name] = [record.to_dict() for record in records_list]
+        try:
+            encode = RecordSerializer._encode
+            with f:
+                f.write(b'{')
+                separator = b'\n  '
+                for collection_name, records_by_id in collections.items():
+                    f.write(separator + encode(collection_name) + b': [')
+                    separator = b',\n  '
+                    # Join batches of encoded records, one write per batch instead of per record
+                    values = iter(records_by_id.values())
+                    prefix = b'\n    '
+                    while batch := [record._to_json() for record in islice(values, _WRITE_BATCH_RECORDS)]:
+                        f.write(prefix + b',\n    '.join(batch))
+                        prefix = b',\n    '
+                    f.write(b'\n  ]' if records_by_id else b']')
+                f.write(b'\n}\n' if collections else b'}\n')
+            RecordSerializer._publish(tmp_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    
+    @staticmethod
+    def _publish(tmp_path: Path) -> Path:
+        """Give a fully written snapshot its final name without overwriting an existing snapshot."""
+        file_path = tmp_path.with_suffix("")
+        while True:
+            try:
+                # A hardlink is atomic and fails instead of replacing a snapshot with the same name
+                os.link(tmp_path, file_path)
+                return file_path
+            except FileExistsError:
+                file_path = tmp_path.with_name(RecordSerializer._get_timestamped_filename())
+            except OSError:
+                # The filesystem has no hardlinks, the name is still unique to this process
+                os.replace(tmp_path, file_path)
+                return file_path
+    
+    @staticmethod
+    async def serialize_and_persist_async(collections: Dict[str, Dict[int, 'Record']], base_path: Path) -> None:
+        """Run serialize_and_persist in a worker thread so the event loop is not blocked."""
+        await asyncio.to_thread(RecordSerializer.serialize_and_persist, collections, base_path)
+    
+    @staticmethod
+    def _load_file(path: Path) -> Any:
+        """Parse a snapshot file, letting orjson read the memory-mapped bytes directly."""
+        if orjson is None:
+            return json.loads(path.read_bytes())
         
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(path, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped, let the parser report them
+                return orjson.loads(b"")
+            with mapped:
+                if _LONG_DIGIT_RUN.search(mapped):
+                    return json.loads(mapped[:])
+                view = memoryview(mapped)
+                try:
+                    return orjson.loads(view)
+                except ValueError:
+                    # orjson rejects some valid JSON, such as escaped lone surrogates
+                    return json.loads(view.tobytes())
+                finally:
+                    view.release()
     
     @staticmethod
-    def load_and_deserialize(base_path: Path, records_class, records_manager) -> Dict[str, List['Record']]:
+    def load_and_deserialize(base_path: Path, records_class, records_manager) -> Dict[str, Dict[int, 'Record']]:
         """Load data from the most recent file and convert back to Record objects."""
         records_dir = base_path.parent / ".records"
         most_recent_file = RecordSerializer._get_most_recent_file(records_dir)
@@ -92,26 +267,15 @@ class RecordSerializer:
         if not most_recent_file:
             return {}
         
-        with open(most_recent_file, 'r') as f:
-            data = json.load(f)
+        data = RecordSerializer._load_file(most_recent_file)
         
         collections = {}
         for collection_name, records_data in data.items():
-            collections[collection_name] = []
+            collections[collection_name] = {}
             for record_data in records_data:
-                # Create a new record instance
-                record_id = record_data.get('id', 0)
-                
-                # Remove id from kwargs since it will be set by the Record constructor
-                kwargs = {k: v for k, v in record_data.items() if k != 'id'}
-                
-                # Create the record
-                record = records_class(collection_name, records_manager, **kwargs)
-                
-                # Override the ID to match the loaded data
-                record._id = record_id
-                
-                collections[collection_name].append(record)
+                # Saved data is trusted, skip validation and change tracking
+                record = records_class._from_dict(collection_name, records_manager, record_data)
+                collections[collection_name][record._id] = record
         
         return collections
     
@@ -5,12 +5,31 @@ Provides data integrity, consistency, and change tracking with an intuitive inte
 """
 
 import json
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 from pathlib import Path
 import atexit
 from .record_serializer import RecordSerializer
 from .records_tracker import RecordsTracker
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, numeric filters fall back to a Python scan
+    np = None
+
+# Record attributes stored as-is, without type enforcement or change tracking
+_INTERNAL_ATTRIBUTES = frozenset(('_records_manager', '_collection_name', '_id', '_data', '_private', '_structure', '_encoded'))
+
+# Attribute types whose values need no recursive JSON validation once the type matches
+_SCALAR_ATTRIBUTE_TYPES = frozenset((bool, int, float, str))
+
+# numpy dtype kinds that compare like Python values of a numeric field type, 'i' for int64 and 'f' for float64
+_NUMPY_KINDS = {int: 'i', float: 'if'}
+
+_NONE_TYPE = type(None)
+
+# Field value types that cannot change in place, records holding only these can cache their encoding
+_IMMUTABLE_VALUE_TYPES = frozenset((bool, int, float, str, _NONE_TYPE))
+
 
 class RecordTypeStructure:
     """Manages structure and type enforcement for a specific record type."""
@@ -18,39 +37,86 @@ class RecordTypeStructure:
     def __init__(self, collection_name: str):
         self.collection_name = collection_name
         self.attributes: Dict[str, Type] = {'id': int}
-        self.structure_changes: List[Dict[str, Any]] = []
+        # Attribute name to type name for each attribute added this session, in order of addition
+        self.structure_changes: Dict[str, str] = {}
     
     def add_attribute(self, name: str, value: Any) -> bool:
         """Add a new attribute to the structure. Returns True if it's a new attribute."""
-        attr_type = type(value)
-        if name in self.attributes:
-            return
-        self.attributes[name] = attr_type
-        self.structure_changes.append({
-            'action': 'add',
-            'collection': self.collection_name,
-            'attribute': name,
-            'type': attr_type.__name__
-        })
+        attributes = self.attributes
+        if name in attributes:
+            return False
+        attr_type = value.__class__
+        attributes[name] = attr_type
+        self.structure_changes[name] = attr_type.__name__
+        return True
 
     def enforce_type(self, name: str, value: Any) -> None:
         """Enforce type for an existing attribute. Raises TypeError if invalid."""
         if value is None:
             return  # None is always allowed
         
-        RecordSerializer.validate_value(value, name, self.collection_name)
-        
-        if name in self.attributes:
-            expected_type = self.attributes[name]
-            if not isinstance(value, expected_type):
+        expected_type = self.attributes.get(name)
+        if expected_type is not None:
+            if type(value) is not expected_type and not isinstance(value, expected_type):
                 raise TypeError(
                     f"Attribute '{name}' in collection '{self.collection_name}' "
                     f"expects type {expected_type.__name__}, got {type(value).__name__}"
                 )
+            if expected_type in _SCALAR_ATTRIBUTE_TYPES:
+                return  # A scalar cannot contain unsupported nested values
+        
+        RecordSerializer.validate_value(value, name, self.collection_name)
+    
+    def set_attribute(self, record: 'Record', name: str, value: Any) -> None:
+        """Set a user field on a record, enforcing its type and tracking structure and content changes."""
+        self.enforce_type(name, value)
+        
+        private = name[0] == '_'
+        data = self.private_fields(record) if private else record._data
+        is_new = name not in data
+        old_value = data.get(name)
+        data[name] = value
+        object.__setattr__(record, '_encoded', None)
+        
+        # Track structure change
+        attributes = self.attributes
+        if name not in attributes:
+            attr_type = value.__class__
+            attributes[name] = attr_type
+            self.structure_changes[name] = attr_type.__name__
+        
+        # Mirror user fields into the collection's columns, unless the record was deleted
+        records_manager = record._records_manager
+        collection_name = self.collection_name
+        record_id = record._id
+        if not private and records_manager._collections.get(collection_name, {}).get(record_id) is record:
+            records_manager._get_columns(collection_name).setdefault(name, {})[record_id] = value
+            numeric_columns = records_manager._numeric_columns.get(collection_name)
+            if numeric_columns:
+                numeric_columns.pop(name, None)
+        
+        # Track content change, True replacing 1 or None set on a new field still changes the snapshot
+        if is_new or old_value != value or type(old_value) is not type(value):
+            records_manager._tracker.track_change(
+                'update', collection_name, record_id, {name: {'old': old_value, 'new': value}}
+            )
+    
+    @staticmethod
+    def private_fields(record: 'Record') -> Dict[str, Any]:
+        """Get or create the dict holding a record's underscore-named fields."""
+        private = record._private
+        if private is None:
+            private = {}
+            object.__setattr__(record, '_private', private)
+        return private
     
     def get_structure_changes(self) -> List[Dict[str, Any]]:
         """Get all structure changes for this record type."""
-        return self.structure_changes.copy()
+        collection_name = self.collection_name
+        return [
+            {'action': 'add', 'collection': collection_name, 'attribute': name, 'type': type_name}
+            for name, type_name in self.structure_changes.items()
+        ]
     
     def to_dict(self) -> Dict[str, str]:
         """Return the structure as a dictionary of attribute names to type names."""
@@ -60,14 +126,21 @@ class RecordTypeStructure:
 class Record:
     """Represents a single record in a collection."""
     
+    # User fields live in _data, so no per-instance __dict__ mixes them with internals.
+    # Fields whose names start with '_' live in _private and are never persisted or queried.
+    __slots__ = ('_collection_name', '_records_manager', '_id', '_data', '_private', '_structure', '_encoded')
+    
     def __init__(self, collection_name: str, records_manager: 'Records', **kwargs):
+        self._data = {}
+        self._private = None
+        self._encoded = None
         self._collection_name = collection_name
         self._records_manager = records_manager
         self._id = records_manager._get_next_id(collection_name)
+        self._structure = records_manager._get_structure(collection_name)
         
-        # Set attributes from kwargs
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+        # Set attributes from kwargs in one pass, the 'add' below covers them all
+        self._bulk_init(kwargs)
         
         # Add to collection
         records_manager._add_record(collection_name, self)
@@ -77,35 +150,74 @@ class Record:
     
     def __setattr__(self, name: str, value: Any):
         # Handle internal attributes normally
-        if name in ('_records_manager', '_collection_name'):
+        if name in _INTERNAL_ATTRIBUTES:
             super().__setattr__(name, value)
             return
         
-        # Get or create the structure for this collection
-        structure = self._records_manager._get_structure(self._collection_name)
-        
-        # Enforce type if it exists
-        structure.enforce_type(name, value)
-        
-        old_value = getattr(self, name, None) if hasattr(self, name) else None
-        super().__setattr__(name, value)
-        
-        # Track structure change
-        structure.add_attribute(name, value)
+        self._structure.set_attribute(self, name, value)
+    
+    @classmethod
+    def _from_dict(cls, collection_name: str, records_manager: 'Records', record_data: Dict[str, Any]) -> 'Record':
+        """Build a record from saved data without validation, id allocation or change tracking."""
+        record = cls.__new__(cls)
+        data = dict(record_data)
+        object.__setattr__(record, '_collection_name', collection_name)
+        object.__setattr__(record, '_records_manager', records_manager)
+        object.__setattr__(record, '_id', data.pop('id', 0))
+        object.__setattr__(record, '_data', data)
+        object.__setattr__(record, '_private', None)
+        object.__setattr__(record, '_encoded', None)
+        structure = records_manager._get_structure(collection_name)
+        object.__setattr__(record, '_structure', structure)
         
-        # Track content change
-        if old_value != value:
-            self._records_manager._tracker.track_change(
-                'update', self._collection_name, self._id, {name: {'old': old_value, 'new': value}}
-            )
+        # Register attribute types without recording them as structure changes.
+        # None only settles the type of a field that no record has a value for.
+        attributes = structure.attributes
+        for key, value in data.items():
+            registered = attributes.get(key)
+            if registered is None or (registered is _NONE_TYPE and value is not None):
+                attributes[key] = value.__class__
+        return record
+    
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names that are not slots, i.e. user fields
+        if name in _INTERNAL_ATTRIBUTES:
+            raise AttributeError(name)
+        try:
+            if name[0] == '_':
+                return (self._private or {})[name]
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'") from None
+    
+    def _bulk_init(self, kwargs: Dict[str, Any]) -> None:
+        """Validate and store initial attributes without tracking a change per attribute."""
+        structure = self._structure
+        enforce_type = structure.enforce_type
+        add_attribute = structure.add_attribute
+        attributes = self._data
+        for key, value in kwargs.items():
+            enforce_type(key, value)
+            if key[0] == '_':
+                structure.private_fields(self)[key] = value
+            else:
+                attributes[key] = value
+            add_attribute(key, value)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert record to dictionary."""
-        result = {'id': self._id}
-        for key, value in self.__dict__.items():
-            if not key.startswith('_'):
-                result[key] = value
-        return result
+        return {'id': self._id, **self._data}
+    
+    def _to_json(self) -> bytes:
+        """Encode the record as JSON bytes, reusing the previous encoding while the record is unchanged."""
+        encoded = self._encoded
+        if encoded is None:
+            data = self._data
+            encoded = RecordSerializer._encode({'id': self._id, **data})
+            # Lists and dicts can be mutated in place without passing through __setattr__
+            if _IMMUTABLE_VALUE_TYPES.issuperset(map(type, data.values())):
+                object.__setattr__(self, '_encoded', encoded)
+        return encoded
 
 
 class Collection:
@@ -117,35 +229,80 @@ class Collection:
     
     def all(self) -> List[Dict[str, Any]]:
         """Return all records in this collection."""
-        return [record.to_dict() for record in self._records_manager._collections.get(self.name, [])]
+        return [record.to_dict() for record in self._records_manager._collections.get(self.name, {}).values()]
     
     def get(self, id: int) -> Optional[Record]:
         """Get a record by ID."""
-        for record in self._records_manager._collections.get(self.name, []):
-            if record._id == id:
-                return record
-        return None
+        return self._records_manager._collections.get(self.name, {}).get(id)
     
     def delete(self, id: int) -> bool:
         """Delete a record by ID."""
-        collection = self._records_manager._collections.get(self.name, [])
-        for i, record in enumerate(collection):
-            if record._id == id:
-                deleted_record = collection.pop(i)
-                self._records_manager._track_content_change('delete', self.name, id, deleted_record.to_dict())
-                return True
-        return False
+        return self._records_manager._delete_record(self.name, id)
     
     def count(self) -> int:
         """Return the number of records in this collection."""
-        return len(self._records_manager._collections.get(self.name, []))
+        return len(self._records_manager._collections.get(self.name, {}))
+    
+    def filter(self, field_or_predicate: Union[str, Callable[[Any], bool]],
+               predicate: Optional[Callable[[Any], bool]] = None) -> List[Dict[str, Any]]:
+        """Return records matching a predicate, converting only the matches to dicts.
+        
+        filter(field, predicate) scans only the field's column and calls predicate with its value.
+        Records without the field, or with it set to None, are skipped.
+        filter(predicate) calls predicate with each Record, e.g. lambda r: getattr(r, 'rating', 0) > 4.
+        """
+        records_by_id = self._records_manager._collections.get(self.name, {})
+        if predicate is None:
+            return [record.to_dict() for record in records_by_id.values() if field_or_predicate(record)]
+        
+        column = self._records_manager._columns.get(self.name, {}).get(field_or_predicate, {})
+        matching_ids = [record_id for record_id, value in column.items() if value is not None and predicate(value)]
+        matching_ids.sort()
+        return [records_by_id[record_id].to_dict() for record_id in matching_ids]
+    
+    def where(self, **conditions: Any) -> List[Dict[str, Any]]:
+        """Return records whose fields equal all given values, e.g. where(location="Amsterdam")."""
+        conditions = list(conditions.items())
+        return [
+            record.to_dict()
+            for record in self._records_manager._collections.get(self.name, {}).values()
+            if all(record._data.get(field) == value for field, value in conditions)
+        ]
+    
+    def filter_numeric(self, field: str, op: Callable[[Any, Any], Any], threshold: Any) -> List[Dict[str, Any]]:
+        """Return records for which op(value, threshold) holds, e.g. op=operator.le.
+        
+        For int and float fields with numpy installed the comparison runs over the whole
+        column at once, the column array is cached until the column changes.
+        Otherwise this is filter() with op applied per value.
+        """
+        manager = self._records_manager
+        structure = manager._structures.get(self.name)
+        field_type = structure.attributes.get(field) if structure is not None else None
+        if np is not None and field_type in (int, float):
+            arrays = manager._get_numeric_column(self.name, field, field_type)
+            if arrays is not None:
+                ids, values = arrays
+                matching_ids = ids[np.nonzero(op(values, threshold))[0]].tolist()
+                records_by_id = manager._collections[self.name] if matching_ids else {}
+                return [records_by_id[record_id].to_dict() for record_id in matching_ids]
+        return self.filter(field, lambda value: op(value, threshold))
+
+
+class _CallableCollection(Collection):
+    """Collection returned by `records.<name>`, calling it creates a record."""
+    
+    def __call__(self, **kwargs) -> Record:
+        return Record(self.name, self._records_manager, **kwargs)
 
 
 class Records:
     """Main interface for managing structured data collections."""
     
-    def __init__(self, path: Path = Path("records.json")):
-        self._collections: Dict[str, List[Record]] = {}
+    def __init__(self, path: Path = Path("records.json"), load: bool = True):
+        self._collections: Dict[str, Dict[int, Record]] = {}
+        self._columns: Dict[str, Dict[str, Dict[int, Any]]] = {}
+        self._numeric_columns: Dict[str, Dict[str, Any]] = {}
         self._next_ids: Dict[str, int] = {}
         self._structures: Dict[str, RecordTypeStructure] = {}
         self._tracker = RecordsTracker()
@@ -154,42 +311,61 @@ class Records:
         # Register cleanup on exit
         atexit.register(self._on_exit)
         
-        # Load existing data if available
-        loaded_collections = RecordSerializer.load_and_deserialize(self._json_path, Record, self)
+        # Load existing data if available, load=False starts empty while still saving next to path
+        loaded_collections = RecordSerializer.load_and_deserialize(self._json_path, Record, self) if load else None
         if loaded_collections:
             self._collections = loaded_collections
-            # Update next IDs based on loaded data
-            for collection_name, records_list in self._collections.items():
-                if records_list:
-                    max_id = max(record._id for record in records_list)
-                    self._next_ids[collection_name] = max_id + 1
-            
-            # Clear out any changes that were tracked during loading
-            self._tracker.clear_changes()
-            for structure in self._structures.values():
-                structure.structure_changes.clear()
+            for collection_name, records_by_id in self._collections.items():
+                # Loaded records bypass _add_record, fill their columns here
+                for record in records_by_id.values():
+                    self._add_to_columns(collection_name, record)
+                # Continue IDs after the highest loaded ID, max over the dict keys runs in C
+                if records_by_id:
+                    self._next_ids[collection_name] = max(records_by_id) + 1
     
     def __getattr__(self, name: str):
         """Dynamic collection access and creation."""
         if name.startswith('_'):
             raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
         
-        # Return a callable that creates records in this collection
-        def create_record(**kwargs):
-            return Record(name, self, **kwargs)
-        
-        # Add collection methods to the callable
-        create_record.all = lambda: [record.to_dict() for record in self._collections.get(name, [])]
-        create_record.get = lambda id: next((record for record in self._collections.get(name, []) if record._id == id), None)
-        create_record.delete = lambda id: self._delete_record(name, id)
-        create_record.count = lambda: len(self._collections.get(name, []))
-        
-        return create_record
+        # Cache on the instance so later accesses never reach __getattr__ again
+        collection = _CallableCollection(name, self)
+        self.__dict__[name] = collection
+        return collection
     
     def __call__(self, collection_name: str, **kwargs) -> Record:
         """Create a new record in the specified collection."""
         return Record(collection_name, self, **kwargs)
     
+    def find(self, collection_name: str, **conditions: Any) -> Optional[Record]:
+        """Return the lowest-id record whose fields equal all given values, or None.
+        
+        e.g. find('location', name="Amsterdam"). As in where(), a missing field equals None.
+        Only the column of the first non-None condition is scanned for candidates.
+        """
+        records_by_id = self._collections.get(collection_name)
+        if not records_by_id:
+            return None
+        
+        # Records without a field match a None condition but have no entry in its column
+        indexed = next(((field, value) for field, value in conditions.items() if value is not None), None)
+        if indexed is None:
+            candidates = records_by_id.keys()
+        else:
+            field, value = indexed
+            column = self._columns.get(collection_name, {}).get(field, {})
+            candidates = (record_id for record_id, column_value in column.items() if column_value == value)
+        
+        conditions = list(conditions.items())
+        record_id = min(
+            (
+                record_id for record_id in candidates
+                if all(records_by_id[record_id]._data.get(field) == value for field, value in conditions)
+            ),
+            default=None,
+        )
+        return records_by_id[record_id] if record_id is not None else None
+    
     def _get_next_id(self, collection_name: str) -> int:
         """Get the next available ID for a collection."""
         if collection_name not in self._next_ids:
@@ -200,19 +376,27 @@ class Records:
     
     def _add_record(self, collection_name: str, record: Record):
         """Add a record to a collection."""
-        if collection_name not in self._collections:
-            self._collections[collection_name] = []
-        self._collections[collection_name].append(record)
+        self._collections.setdefault(collection_name, {})[record._id] = record
+        self._add_to_columns(collection_name, record)
+    
+    def _add_to_columns(self, collection_name: str, record: Record):
+        """Mirror every public field of a record into the collection's columns."""
+        self._numeric_columns.pop(collection_name, None)
+        columns = self._get_columns(collection_name)
+        record_id = record._id
+        for field, value in record._data.items():
+            columns.setdefault(field, {})[record_id] = value
     
     def _delete_record(self, collection_name: str, record_id: int) -> bool:
         """Delete a record by ID from a collection."""
-        collection = self._collections.get(collection_name, [])
-        for i, record in enumerate(collection):
-            if record._id == record_id:
-                deleted_record = collection.pop(i)
-                self._tracker.track_change('delete', collection_name, record_id, deleted_record.to_dict())
-                return True
-        return False
+        deleted_record = self._collections.get(collection_name, {}).pop(record_id, None)
+        if deleted_record is None:
+            return False
+        for column in self._columns.get(collection_name, {}).values():
+            column.pop(record_id, None)
+        self._numeric_columns.pop(collection_name, None)
+        self._tracker.track_change('delete', collection_name, record_id, deleted_record.to_dict())
+        return True
     
     def _get_structure(self, collection_name: str) -> RecordTypeStructure:
         """Get or create the structure for a collection."""
@@ -220,6 +404,35 @@ class Records:
             self._structures[collection_name] = RecordTypeStructure(collection_name)
         return self._structures[collection_name]
     
+    def _get_columns(self, collection_name: str) -> Dict[str, Dict[int, Any]]:
+        """Get or create the field -> (id -> value) columns for a collection."""
+        if collection_name not in self._columns:
+            self._columns[collection_name] = {}
+        return self._columns[collection_name]
+    
+    def _get_numeric_column(self, collection_name: str, field: str, field_type: Type):
+        """Get the cached (ids, values) numpy arrays of a numeric column, sorted by id.
+        
+        Returns None if the values do not all convert to a 64-bit numpy dtype of the field's kind,
+        e.g. a loaded snapshot holding floats in an int column, bools, or integers beyond 64 bits.
+        """
+        numeric_columns = self._numeric_columns.setdefault(collection_name, {})
+        arrays = numeric_columns.get(field)
+        if arrays is None:
+            column = self._columns.get(collection_name, {}).get(field, {})
+            present = sorted((record_id, value) for record_id, value in column.items() if value is not None)
+            try:
+                values = np.array([value for _, value in present])
+            except OverflowError:
+                values = None
+            if values is None or values.dtype.kind not in _NUMPY_KINDS[field_type]:
+                # Cache the miss too, the column is scanned in Python until it changes
+                arrays = numeric_columns[field] = False
+            else:
+                ids = np.array([record_id for record_id, _ in present], dtype=np.int64)
+                arrays = numeric_columns[field] = (ids, values)
+        return arrays or None
+    
 
     
     def structure(self) -> Dict[str, Dict[str, str]]:
@@ -244,17 +457,51 @@ class Records:
         return report
     
 
+    def _has_unsaved_changes(self) -> bool:
+        """Return True if the data may differ from the most recent snapshot."""
+        if self._tracker.has_changes():
+            return True
+        if any(structure.structure_changes for structure in self._structures.values()):
+            return True
+        # Lists and dicts can be edited in place without passing through the tracker
+        return any(
+            issubclass(attr_type, (list, dict))
+            for collection_name, structure in self._structures.items()
+            if self._collections.get(collection_name)
+            for attr_type in structure.attributes.values()
+        )
+    
+    def save(self) -> bool:
+        """Persist a snapshot if anything may have changed since the last save. Returns True if one was written.
+        
+        Collections with list or dict fields are always written, edits made in place to those are not tracked.
+        """
+        if not self._has_unsaved_changes():
+            return False
+        RecordSerializer.serialize_and_persist(self._collections, self._json_path)
+        self._tracker.clear_changes()
+        for structure in self._structures.values():
+            structure.structure_changes.clear()
+        return True
+    
     def _on_exit(self):
         """Called on program exit to persist data and generate reports."""
+        # Reports describe the changes being persisted, build them before save() clears them.
+        # Without tracked changes or list and dict fields, a new snapshot would only duplicate the loaded one
+        structure_report = self._generate_structure_report()
+        content_report = self._tracker.generate_report(self._collections)
+        
+        persisted = False
         try:
-            RecordSerializer.serialize_and_persist(self._collections, self._json_path)
+            persisted = self.save()
         except (FileNotFoundError, OSError):
             # Temp directory may have been cleaned up already, skip persistence
             pass
         
-        print(self._generate_structure_report())
-        print(self._tracker.generate_report(self._collections))
-        print("To undo ALL of the above changes, invoke `records.undo()` once.")
+        print(structure_report)
+        print(content_report)
+        if persisted:
+            print("To undo ALL of the above changes, invoke `records.undo()` once.")
     
     def undo(self):
         """Undo all changes by removing the most recent save file."""
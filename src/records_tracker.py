@@ -2,6 +2,7 @@
 RecordsTracker - Handles content change tracking and reporting for Records.
 """
 
+import sys
 from typing import Any, Dict, List, Tuple
 
 
@@ -9,24 +10,45 @@ class RecordsTracker:
     """Tracks and reports content changes for Records collections."""
     
     def __init__(self):
-        self._content_changes: List[Dict[str, Any]] = []
+        # Net change per (collection, record_id), folded as changes come in
+        self._content_changes: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._tracked_any = False
     
     def track_change(self, action: str, collection_name: str, record_id: int, data: Any) -> None:
-        """Track a content change."""
-        self._content_changes.append({
+        """Track a content change, folding it into the record's net change."""
+        self._tracked_any = True
+        # Names loaded from snapshots are not interned, interning makes key comparisons identity checks
+        collection_name = sys.intern(collection_name)
+        key = (collection_name, record_id)
+        pending = self._content_changes.get(key)
+        
+        if action == 'update' and pending is not None:
+            # Created and modified = still just created, modified again = still modified
+            return
+        if action == 'delete' and pending is not None and pending['action'] == 'add':
+            # Created then deleted = no net change
+            del self._content_changes[key]
+            return
+        
+        self._content_changes[key] = {
             'action': action,
             'collection': collection_name,
             'record_id': record_id,
             'data': data
-        })
+        }
     
     def clear_changes(self) -> None:
         """Clear all tracked changes."""
         self._content_changes.clear()
+        self._tracked_any = False
+    
+    def has_changes(self) -> bool:
+        """Return True if any record has a net content change."""
+        return bool(self._content_changes)
     
     def get_changes(self) -> List[Dict[str, Any]]:
-        """Get all tracked changes."""
-        return self._content_changes.copy()
+        """Get the net tracked change of every record, in order of first change."""
+        return list(self._content_changes.values())
     
     def _format_record_for_report(self, record_dict: Dict[str, Any], max_length: int = 150) -> str:
         """Format a record for display in reports, truncating if too long."""
@@ -47,57 +69,21 @@ class RecordsTracker:
         
         return record_repr
     
-    def generate_report(self, collections: Dict[str, List['Record']]) -> str:
+    def generate_report(self, collections: Dict[str, Dict[int, 'Record']]) -> str:
         """Generate content changes report showing actual entities created, modified, and deleted."""
-        if not self._content_changes:
+        if not self._tracked_any:
             return "No content changes."
         
-        # Track record states and data
-        record_tracking = {}  # (collection, record_id) -> {'state': str, 'data': dict}
-        
-        for change in self._content_changes:
-            key = (change['collection'], change['record_id'])
-            
-            if change['action'] == 'add':
-                record_tracking[key] = {
-                    'state': 'created',
-                    'data': change['data'],
-                    'collection': change['collection']
-                }
-            elif change['action'] == 'update':
-                if key in record_tracking:
-                    if record_tracking[key]['state'] == 'created':
-                        # Created and modified = still just created
-                        continue
-                    elif record_tracking[key]['state'] == 'modified':
-                        # Already modified, keep as modified
-                        continue
-                else:
-                    # First time seeing this record, must be a modification of existing
-                    record_tracking[key] = {
-                        'state': 'modified',
-                        'data': change['data'],
-                        'collection': change['collection']
-                    }
-            elif change['action'] == 'delete':
-                if key in record_tracking and record_tracking[key]['state'] == 'created':
-                    # Created then deleted = no net change, remove from tracking
-                    del record_tracking[key]
-                else:
-                    # Was existing (or modified) and deleted
-                    record_tracking[key] = {
-                        'state': 'deleted',
-                        'data': change['data'],
-                        'collection': change['collection']
-                    }
-        
-        if not record_tracking:
+        if not self._content_changes:
             return "No net content changes."
         
-        # Group by state
-        created = [(k, v) for k, v in record_tracking.items() if v['state'] == 'created']
-        modified = [(k, v) for k, v in record_tracking.items() if v['state'] == 'modified']
-        deleted = [(k, v) for k, v in record_tracking.items() if v['state'] == 'deleted']
+        # Group by net action
+        created = []
+        modified = []
+        deleted = []
+        groups = {'add': created, 'update': modified, 'delete': deleted}
+        for key, change in self._content_changes.items():
+            groups[change['action']].append((key, change))
         
         report = "Content changes:\n"
         
@@ -108,13 +94,9 @@ class RecordsTracker:
                 report += f"... and {remaining} more created records\n"
                 break
             # Show the final state of created records
-            current_record = None
-            for record in collections.get(collection, []):
-                if record._id == record_id:
-                    current_record = record.to_dict()
-                    break
-            if current_record:
-                formatted_record = self._format_record_for_report(current_record)
+            current_record = collections.get(collection, {}).get(record_id)
+            if current_record is not None:
+                formatted_record = self._format_record_for_report(current_record.to_dict())
                 report += f"+ {collection}({formatted_record})\n"
         
         # Show modified records (limit to 5)
@@ -123,13 +105,9 @@ class RecordsTracker:
                 remaining = len(modified) - 5
                 report += f"... and {remaining} more modified records\n"
                 break
-            current_record = None
-            for record in collections.get(collection, []):
-                if record._id == record_id:
-                    current_record = record.to_dict()
-                    break
-            if current_record:
-                formatted_record = self._format_record_for_report(current_record)
+            current_record = collections.get(collection, {}).get(record_id)
+            if current_record is not None:
+                formatted_record = self._format_record_for_report(current_record.to_dict())
                 report += f"~ {collection}(id={record_id}, {formatted_record})\n"
         
         # Show deleted records (limit to 5)
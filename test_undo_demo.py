@@ -2,7 +2,6 @@
 """Test undo functionality with proper timing."""
 
 import tempfile
-import time
 from pathlib import Path
 from src.records import Records
 from src.record_serializer import RecordSerializer
@@ -15,8 +14,6 @@ with tempfile.TemporaryDirectory() as temp_dir:
     records1.location(name="Amsterdam")
     RecordSerializer.serialize_and_persist(records1._collections, records1._json_path)
     
-    time.sleep(0.01)  # Ensure different timestamp
-    
     # Save 2: Amsterdam + Berlin + Fight Club
     records1.location(name="Berlin") 
     records1.gym(name="Fight Club")
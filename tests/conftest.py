@@ -0,0 +1,18 @@
+"""
+Shared pytest setup for the Records tests.
+"""
+
+import os
+import tempfile
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def ram_backed_tempdir():
+    """Put test temporary directories on /dev/shm when available, so snapshot writes skip the disk."""
+    previous = tempfile.tempdir
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        tempfile.tempdir = "/dev/shm"
+    yield
+    tempfile.tempdir = previous
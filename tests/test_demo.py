@@ -33,6 +33,10 @@ def test_records_demo():
         
         # Delete a gym
         records.gym.delete(1)
+        
+        # Collection access is cached per name
+        assert records.gym is records.gym
+        assert records.gym.count() == 2
 
 if __name__ == "__main__":
     test_records_demo()
@@ -2,6 +2,7 @@
 Test showing Records save/load cycle with basic filtering.
 """
 
+import operator
 import tempfile
 from pathlib import Path
 from src.records import Records
@@ -53,13 +54,81 @@ def test_full_save_load_cycle():
         assert "Heavy Bag Training" in nearby_names
         assert "Boxing Gym Central" not in nearby_names  # 35 min, not ≤30
         
+        # Same filter, scanning only the travel_time column
+        assert records.gym.filter('travel_time', lambda minutes: minutes <= 30) == nearby_gyms
+        assert records.gym.filter_numeric('travel_time', operator.le, 30) == nearby_gyms
+        assert records.gym.filter(lambda gym: getattr(gym, 'travel_time', 0) <= 30) == nearby_gyms
+        assert len(records.gym.where(location="Amsterdam")) == 3
+        assert [gym['name'] for gym in records.gym.where(location="Amsterdam", travel_time=35)] == ["Boxing Gym Central"]
+        assert records.location.where(name="Amsterdam Center")[0]['address'] == "Dam Square, Amsterdam, Netherlands"
+        
         # Delete a gym and verify
         deleted = records.gym.delete(1)  # Boxing Gym Central
         assert deleted == True
         assert records.gym.count() == 2
+        assert [gym['name'] for gym in records.gym.filter('travel_time', lambda minutes: minutes <= 40)] == ["Fight Club Amsterdam", "Heavy Bag Training"]
+        assert [gym['name'] for gym in records.gym.filter_numeric('travel_time', operator.le, 40)] == ["Fight Club Amsterdam", "Heavy Bag Training"]
+        
+        # Updates are visible to column filters
+        records.gym.get(2).travel_time = 45
+        assert [gym['name'] for gym in records.gym.filter('travel_time', lambda minutes: minutes <= 30)] == ["Fight Club Amsterdam"]
+        assert [gym['name'] for gym in records.gym.filter_numeric('travel_time', operator.gt, 40)] == ["Heavy Bag Training"]
         
         print("✅ Full cycle test passed!")
 
 
+def test_numeric_filter_on_mixed_loaded_column():
+    """Test that numeric filters do not truncate floats loaded into an int column."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_file = Path(temp_dir) / "demo_data.json"
+        records_dir = data_file.parent / ".records"
+        records_dir.mkdir()
+        (records_dir / "1.json").write_text('{"session": [{"id": 0, "t": 1}, {"id": 1, "t": 2.9}]}')
+        
+        records = Records(data_file)
+        assert records.structure()['session']['t'] == 'int'
+        assert records.session.filter('t', lambda t: t <= 2) == [{'id': 0, 't': 1}]
+        assert records.session.filter_numeric('t', operator.le, 2) == [{'id': 0, 't': 1}]
+        
+        print("✅ Mixed column filter test passed!")
+
+
+def test_find_matches_like_where():
+    """Test that find treats a missing field as None whatever the order of the conditions."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        records = Records(Path(temp_dir) / "demo_data.json")
+        records.c(b=1)
+        records.c(a=5, b=1)
+        
+        assert records.c.where(a=None, b=1) == [{'id': 0, 'b': 1}]
+        assert records.find('c', a=None, b=1)._id == 0
+        assert records.find('c', b=1, a=None)._id == 0
+        assert records.find('c', b=1, a=5)._id == 1
+        assert records.find('c', a=5, b=1)._id == 1
+        assert records.find('c', a=None)._id == 0
+        assert records.find('c')._id == 0
+        assert records.find('c', a=6) is None
+        
+        print("✅ Find test passed!")
+
+
+def test_write_to_deleted_record():
+    """Test that writing to a deleted record does not put it back into the column filters."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        records = Records(Path(temp_dir) / "demo_data.json")
+        gym = records.gym(t=1)
+        records.gym.delete(0)
+        gym.t = 5
+        
+        assert records.gym.filter('t', lambda t: t == 5) == []
+        assert records.gym.filter_numeric('t', operator.ge, 0) == []
+        assert records.find('gym', t=5) is None
+        
+        print("✅ Deleted record write test passed!")
+
+
 if __name__ == "__main__":
     test_full_save_load_cycle()
+    test_numeric_filter_on_mixed_loaded_column()
+    test_find_matches_like_where()
+    test_write_to_deleted_record()
@@ -6,6 +6,7 @@ import tempfile
 from pathlib import Path
 from datetime import datetime
 from src.records import Records
+from src.record_serializer import RecordSerializer
 
 
 class CustomObject:
@@ -72,6 +73,36 @@ def test_json_types():
             print("✗ List with invalid content incorrectly accepted")
         except TypeError as e:
             print(f"✓ List with invalid content correctly rejected: {e}")
+        
+        # Test self-referencing list
+        cyclic = [1]
+        cyclic.append(cyclic)
+        try:
+            record.bad_cycle = cyclic
+            assert False, "Self-referencing list incorrectly accepted"
+        except TypeError as e:
+            print(f"✓ Self-referencing list correctly rejected: {e}")
+        
+        # Test deep nesting and shared (non-cyclic) containers
+        deep = "leaf"
+        for _ in range(512):
+            deep = [deep]
+        record.deep = deep
+        too_deep = "leaf"
+        for _ in range(5000):
+            too_deep = [too_deep]
+        try:
+            record.too_deep = too_deep
+            assert False, "Too deeply nested list incorrectly accepted"
+        except TypeError as e:
+            print(f"✓ Too deeply nested list correctly rejected: {e}")
+        assert not RecordSerializer.is_supported_value([deep])
+        records.save()
+        assert Records(records._json_path).test_record.get(record._id).deep == deep
+        shared = {"level": [1, 2]}
+        assert RecordSerializer.is_supported_value([shared, {"again": shared}])
+        assert not RecordSerializer.is_supported_value([[1], [2, {"k": {3}}]])
+        print("✓ Deep and shared structures handled")
 
 
 if __name__ == "__main__":
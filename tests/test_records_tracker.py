@@ -2,21 +2,22 @@
 Test RecordsTracker functionality.
 """
 
+import tempfile
+from pathlib import Path
+from src.records import Records
 from src.records_tracker import RecordsTracker
 
 
 class MockRecord:
     """Mock Record class for testing."""
+    __slots__ = ('_id', '_data')
+    
     def __init__(self, record_id: int, **kwargs):
         self._id = record_id
-        self.__dict__.update(kwargs)
+        self._data = kwargs
     
     def to_dict(self):
-        result = {'id': self._id}
-        for key, value in self.__dict__.items():
-            if not key.startswith('_'):
-                result[key] = value
-        return result
+        return {'id': self._id, **self._data}
 
 
 def test_basic_tracking():
@@ -66,10 +67,10 @@ def test_report_generation():
     
     # Create mock collections
     collections = {
-        'users': [
-            MockRecord(1, name='Alice', age=30),
-            MockRecord(2, name='Bob', age=25)
-        ]
+        'users': {
+            1: MockRecord(1, name='Alice', age=30),
+            2: MockRecord(2, name='Bob', age=25)
+        }
     }
     
     # Track creation
@@ -106,7 +107,7 @@ def test_create_then_modify():
     
     tracker = RecordsTracker()
     collections = {
-        'users': [MockRecord(1, name='Alice Updated', age=31)]
+        'users': {1: MockRecord(1, name='Alice Updated', age=31)}
     }
     
     # Create then modify
@@ -127,7 +128,7 @@ def test_modify_existing():
     
     tracker = RecordsTracker()
     collections = {
-        'users': [MockRecord(1, name='Alice Updated', age=31)]
+        'users': {1: MockRecord(1, name='Alice Updated', age=31)}
     }
     
     # Only modification (no prior add in this session)
@@ -155,6 +156,43 @@ def test_delete_existing():
     print("✓ Delete existing works")
 
 
+def test_changes_fold_per_record():
+    """Test that repeated changes to a record are kept as a single net change."""
+    print("Testing changes fold per record...")
+    
+    tracker = RecordsTracker()
+    
+    tracker.track_change('add', 'users', 1, {'name': 'Alice'})
+    for age in range(10):
+        tracker.track_change('update', 'users', 1, {'age': {'old': age, 'new': age + 1}})
+    tracker.track_change('update', 'users', 2, {'name': {'old': 'Bob', 'new': 'Robert'}})
+    tracker.track_change('update', 'users', 2, {'age': {'old': 25, 'new': 26}})
+    tracker.track_change('add', 'users', 3, {'name': 'Carol'})
+    tracker.track_change('delete', 'users', 3, {'id': 3, 'name': 'Carol'})
+    
+    changes = tracker.get_changes()
+    assert [(c['action'], c['record_id']) for c in changes] == [('add', 1), ('update', 2)]
+    assert changes[1]['data'] == {'name': {'old': 'Bob', 'new': 'Robert'}}
+    
+    print("✓ Changes fold per record")
+
+
+def test_create_tracks_single_change():
+    """Test that creating a record tracks one change, not one per attribute."""
+    print("Testing create tracks a single change...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        records = Records(Path(temp_dir) / "tracker_test.json")
+        records.users(name='Alice', age=30, city='Amsterdam')
+        
+        changes = [c for c in records._tracker.get_changes() if 'name' in c['data']]
+        assert len(changes) == 1
+        assert changes[0]['action'] == 'add'
+        assert changes[0]['data'] == {'name': 'Alice', 'age': 30, 'city': 'Amsterdam'}
+    
+    print("✓ Create tracks a single change")
+
+
 if __name__ == "__main__":
     test_basic_tracking()
     test_clear_changes()
@@ -163,4 +201,6 @@ if __name__ == "__main__":
     test_create_then_modify()
     test_modify_existing()
     test_delete_existing()
+    test_changes_fold_per_record()
+    test_create_tracks_single_change()
     print("\nAll RecordsTracker tests passed! ✅")
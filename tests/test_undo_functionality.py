@@ -3,7 +3,6 @@ Test undo functionality for Records.
 """
 
 import tempfile
-import time
 from pathlib import Path
 from src.records import Records
 from src.record_serializer import RecordSerializer
@@ -21,8 +20,6 @@ def test_undo_restores_previous_state():
         records1.location(name="Amsterdam")
         RecordSerializer.serialize_and_persist(records1._collections, records1._json_path)
         
-        time.sleep(0.01)  # Ensure different timestamp
-        
         # Save 2: Amsterdam + Berlin + Fight Club
         records1.location(name="Berlin") 
         records1.gym(name="Fight Club")
@@ -58,7 +55,168 @@ def test_undo_with_no_saves():
     print("✓ Undo with no saves handled correctly")
 
 
+def test_exit_without_changes_keeps_snapshots():
+    """Test that exiting without content changes does not write a new snapshot."""
+    print("Testing exit without changes...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        demo_file = Path(temp_dir) / "test_records.json"
+        records_dir = demo_file.parent / ".records"
+        
+        records1 = Records(demo_file)
+        records1.location(name="Amsterdam")
+        records1._on_exit()
+        assert len(list(records_dir.glob("*.json"))) == 1
+        
+        # Loading and reading only must not add a snapshot that undo would then remove
+        records2 = Records(demo_file)
+        assert records2.location.count() == 1
+        records2._on_exit()
+        assert len(list(records_dir.glob("*.json"))) == 1
+    
+    print("✓ Exit without changes keeps snapshots")
+
+
+def test_exit_persists_in_place_edits():
+    """Test that edits made in place to list fields are persisted on exit."""
+    print("Testing in-place edits on exit...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        demo_file = Path(temp_dir) / "test_records.json"
+        
+        records1 = Records(demo_file)
+        records1.gym(name="Fight Club", tags=["x"])
+        records1._on_exit()
+        
+        records2 = Records(demo_file)
+        records2.gym.get(0).tags.append("y")
+        records2._on_exit()
+        
+        records3 = Records(demo_file)
+        assert records3.gym.get(0).tags == ["x", "y"]
+    
+    print("✓ In-place edits are persisted on exit")
+
+
+def test_exit_persists_writes_equal_to_old_value():
+    """Test that writes comparing equal to the old value, but changing the snapshot, are persisted on exit."""
+    print("Testing equal-comparing writes on exit...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        demo_file = Path(temp_dir) / "test_records.json"
+        
+        records1 = Records(demo_file)
+        records1.location(name="Amsterdam", n=1)
+        records1._on_exit()
+        
+        records2 = Records(demo_file)
+        location = records2.location.get(0)
+        location.note = None
+        location.n = True
+        records2._on_exit()
+        
+        assert Records(demo_file).location.get(0).to_dict() == {'id': 0, 'name': "Amsterdam", 'n': True, 'note': None}
+    
+    print("✓ Equal-comparing writes are persisted on exit")
+
+
+def test_save_writes_only_changes():
+    """Test that save() writes a snapshot only when something changed since the last save."""
+    print("Testing save...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        demo_file = Path(temp_dir) / "test_records.json"
+        records_dir = demo_file.parent / ".records"
+        
+        records1 = Records(demo_file)
+        assert records1.save() is False
+        amsterdam = records1.location(name="Amsterdam")
+        assert records1.save() is True
+        assert records1.save() is False
+        assert len(list(records_dir.glob("*.json"))) == 1
+        assert records1._generate_structure_report() == "No structure changes."
+        
+        amsterdam.name = "Amsterdam Centrum"
+        assert records1.save() is True
+        records1._on_exit()
+        assert len(list(records_dir.glob("*.json"))) == 2
+        
+        # In-place edits are not tracked, records with list fields are always saved
+        gym = records1.gym(name="Fight Club", tags=["boxing"])
+        assert records1.save() is True
+        gym.tags.append("judo")
+        assert records1.save() is True
+        assert Records(demo_file).gym.get(0).tags == ["boxing", "judo"]
+        
+        # A new field set to None compares equal to the missing value, it is still saved
+        amsterdam.note = None
+        assert records1.save() is True
+        assert Records(demo_file).location.get(0).to_dict() == {'id': 0, 'name': "Amsterdam Centrum", 'note': None}
+        
+        # A list field whose first loaded value is null still counts as a list field
+        loaded_file = Path(temp_dir) / "loaded" / "test_records.json"
+        (loaded_file.parent / ".records").mkdir(parents=True)
+        (loaded_file.parent / ".records" / "1.json").write_text(
+            '{"gym": [{"id": 0, "tags": null}, {"id": 1, "tags": ["a"]}]}'
+        )
+        records2 = Records(loaded_file)
+        records2.gym.get(1).tags.append("b")
+        assert records2.save() is True
+        assert Records(loaded_file).gym.get(1).tags == ["a", "b"]
+    
+    print("✓ Save writes only changes")
+
+
+def test_legacy_snapshot_names_sort_first():
+    """Test that snapshots named by older versions are older than new ones."""
+    print("Testing legacy snapshot names...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        demo_file = Path(temp_dir) / "test_records.json"
+        records_dir = demo_file.parent / ".records"
+        records_dir.mkdir()
+        (records_dir / "20991231_235959_999.json").write_text('{"location": [{"id": 0, "name": "Legacy"}]}')
+        
+        records1 = Records(demo_file)
+        assert records1.location.get(0).name == "Legacy"
+        records1.location.get(0).name = "Current"
+        RecordSerializer.serialize_and_persist(records1._collections, records1._json_path)
+        
+        records2 = Records(demo_file)
+        assert records2.location.get(0).name == "Current"
+    
+    print("✓ Legacy snapshot names sort first")
+
+
+def test_back_to_back_saves_get_distinct_snapshots():
+    """Test that saves without any pause each get their own, increasing snapshot."""
+    print("Testing back-to-back saves...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        demo_file = Path(temp_dir) / "test_records.json"
+        records1 = Records(demo_file)
+        for i in range(20):
+            records1.location(name=f"Location {i}")
+            RecordSerializer.serialize_and_persist(records1._collections, records1._json_path)
+        
+        snapshots = sorted(int(path.stem) for path in (demo_file.parent / ".records").glob("*.json"))
+        assert len(snapshots) == 20
+        assert not list((demo_file.parent / ".records").glob("*.tmp"))
+        
+        records1.undo()
+        records2 = Records(demo_file)
+        assert records2.location.count() == 19
+    
+    print("✓ Back-to-back saves get distinct snapshots")
+
+
 if __name__ == "__main__":
     test_undo_restores_previous_state()
     test_undo_with_no_saves()
+    test_exit_without_changes_keeps_snapshots()
+    test_exit_persists_in_place_edits()
+    test_exit_persists_writes_equal_to_old_value()
+    test_save_writes_only_changes()
+    test_legacy_snapshot_names_sort_first()
+    test_back_to_back_saves_get_distinct_snapshots()
     print("\nAll undo functionality tests passed! ✅")